@@ -1,7 +1,7 @@
 """Entry point for running paperbot as a module or installed script.
 
 Usage:
-    paperbot / python -m paperbot         → GUI (streamlit run)
+    paperbot / python -m paperbot         → GUI (uvicorn + browser)
     paperbot <command> ... / python -m paperbot <command> ... → CLI
 """
 
@@ -9,19 +9,29 @@ import atexit
 import sys
 
 def _reset_picked_on_exit() -> None:
-    """Reset all is_picked to 0 when the process exits."""
+    """Reset all is_picked to 0 when the process exits.
+
+    Reuses the GUI's already-open repository when one exists so exit
+    doesn't pay a second ``sqlite3.connect`` + schema check; the GUI
+    state module is looked up via ``sys.modules`` to avoid importing
+    the whole GUI stack on CLI-only runs.  ``Settings.load()`` is a
+    cached singleton, so the fallback path re-reads nothing from disk.
+    """
     try:
-        from paperbot.config import Settings
-        from paperbot.database.repository import PaperRepository
-        settings = Settings.load()
-        repo = PaperRepository(settings.db_path)
+        repo = None
+        state_mod = sys.modules.get("paperbot.gui.state")
+        if state_mod is not None:
+            repo = getattr(state_mod.state, "repo", None)
+        if repo is None:
+            from paperbot.config import Settings
+            from paperbot.database.repository import PaperRepository
+            repo = PaperRepository(Settings.load().db_path)
         repo.reset_all_picked()
     except Exception:
         pass  # avoid breaking process exit
 
 def run() -> None:
-    """Entry point: no args → GUI (via streamlit run), else → CLI."""
-        
+    """Entry point: no args → GUI, else → CLI."""
     atexit.register(_reset_picked_on_exit)
     if len(sys.argv) == 1:
         from paperbot.ui import run_ui
@@ -2,17 +2,44 @@
 
 import hashlib
 import sqlite3
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Any, Iterator, Optional
 
 from paperbot.models.paper import Paper
 
 
+def _like_pattern(q: str) -> str:
+    """Build a contains-match LIKE pattern, escaping SQL wildcards in *q*."""
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _search_text(
+    title: Optional[str], journal: Optional[str], authors: Optional[str],
+) -> str:
+    """Precompute the lowercase title/journal/authors blob for search.
+
+    Stored in the ``search_text`` column at insert time so queries match
+    against one normalized column instead of lower-folding three columns
+    per row on every search.  Folding happens in Python (full Unicode),
+    not SQLite's ASCII-only ``lower()``.
+    """
+    return " ".join(
+        part for part in (title, journal, authors) if part
+    ).lower()
+
+
 class PaperRepository:
     """Repository for paper CRUD operations using SQLite."""
 
+    # TTL for cached aggregate queries (status counts, journal list).
+    # Short enough that concurrent CLI writes surface quickly, long
+    # enough to absorb the GUI's polling bursts.
+    STATS_CACHE_TTL = 5.0
+
     def __init__(self, db_path: Path):
         """Initialize repository with database path.
 
@@ -20,8 +47,32 @@ class PaperRepository:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._stats_cache: dict[str, tuple[float, Any]] = {}
         self._init_db()
 
+    # ------------------------------------------------------------------
+    # Aggregate-query cache
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: str) -> Any:
+        """Return a cached value for *key*, or None if missing/expired."""
+        entry = self._stats_cache.get(key)
+        if entry is None:
+            return None
+        stamp, value = entry
+        if time.monotonic() - stamp >= self.STATS_CACHE_TTL:
+            return None
+        return value
+
+    def _cache_put(self, key: str, value: Any) -> Any:
+        """Store *value* under *key* with the current timestamp."""
+        self._stats_cache[key] = (time.monotonic(), value)
+        return value
+
+    def _invalidate_stats_cache(self) -> None:
+        """Drop cached aggregates; call after any write to ``papers``."""
+        self._stats_cache.clear()
+
     @contextmanager
     def _connection(self) -> Iterator[sqlite3.Connection]:
         """Context manager for database connections."""
@@ -48,6 +99,7 @@ class PaperRepository:
                     authors TEXT,
                     journal TEXT,
                     abstract TEXT,
+                    search_text TEXT,
                     status TEXT NOT NULL DEFAULT 'new',
                     is_picked INTEGER NOT NULL DEFAULT 0,
                     UNIQUE(doi),
@@ -102,7 +154,23 @@ class PaperRepository:
                 # Migrate: status='picked' → is_picked=1, status='new'
                 cursor.execute("UPDATE papers SET is_picked = 1, status = 'new' WHERE status = 'picked'")
                 conn.commit()
-            
+
+            # Migrate: backfill precomputed lowercase search column.
+            # Fold in Python so legacy rows match queries beyond ASCII,
+            # same as rows written by upsert.
+            if "search_text" not in columns:
+                cursor.execute("ALTER TABLE papers ADD COLUMN search_text TEXT")
+                cursor.execute("SELECT id, title, journal, authors FROM papers")
+                backfill = [
+                    (_search_text(row["title"], row["journal"], row["authors"]), row["id"])
+                    for row in cursor.fetchall()
+                ]
+                cursor.executemany(
+                    "UPDATE papers SET search_text = ? WHERE id = ?",
+                    backfill,
+                )
+                conn.commit()
+
             conn.commit()
 
     def upsert(self, paper: Paper) -> bool:
@@ -121,8 +189,8 @@ class PaperRepository:
             cursor.execute(
                 """
                 INSERT OR IGNORE INTO papers
-                (created_at, source, title, link, doi, published, authors, journal, abstract, status, is_picked)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'new', 0)
+                (created_at, source, title, link, doi, published, authors, journal, abstract, search_text, status, is_picked)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'new', 0)
                 """,
                 (
                     now,
@@ -134,11 +202,62 @@ class PaperRepository:
                     paper.authors,
                     paper.journal,
                     paper.abstract,
+                    _search_text(paper.title, paper.journal, paper.authors),
                 ),
             )
             conn.commit()
+            if cursor.rowcount > 0:
+                self._invalidate_stats_cache()
             return cursor.rowcount > 0
 
+    def upsert_many(self, papers: list[Paper]) -> int:
+        """Insert many papers in a single transaction (skip existing).
+
+        One connection, one ``executemany``, one commit — avoids the
+        per-paper connect/commit overhead of calling :meth:`upsert` in
+        a loop during a fetch.
+
+        Args:
+            papers: Paper objects to insert
+
+        Returns:
+            Number of papers actually inserted (duplicates are ignored)
+        """
+        if not papers:
+            return 0
+
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                now,
+                paper.source,
+                paper.title,
+                paper.link,
+                paper.doi,
+                paper.published,
+                paper.authors,
+                paper.journal,
+                paper.abstract,
+                _search_text(paper.title, paper.journal, paper.authors),
+            )
+            for paper in papers
+        ]
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO papers
+                (created_at, source, title, link, doi, published, authors, journal, abstract, search_text, status, is_picked)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'new', 0)
+                """,
+                rows,
+            )
+            conn.commit()
+            inserted = cursor.rowcount
+        if inserted > 0:
+            self._invalidate_stats_cache()
+        return inserted
+
     def get_new_paper_ids(self) -> list[int]:
         """Return IDs of all papers with status='new'.
 
@@ -170,6 +289,7 @@ class PaperRepository:
                 paper_ids,
             )
             conn.commit()
+            self._invalidate_stats_cache()
             return cursor.rowcount
 
     def find_by_status(
@@ -180,6 +300,7 @@ class PaperRepository:
         sort_by: str = "id",
         order: str = "desc",
         journal: Optional[str] = None,
+        q: Optional[str] = None,
     ) -> list[Paper]:
         """Find papers by status (or pseudo-status 'picked' for is_picked=1).
 
@@ -190,6 +311,7 @@ class PaperRepository:
             sort_by: Sort key - 'id', 'date', or 'title' (default: id)
             order: 'asc' or 'desc' for sort direction
             journal: If set, filter by this journal name only.
+            q: If set, match this substring in title/journal/authors.
 
         Returns:
             List of Paper objects
@@ -206,103 +328,78 @@ class PaperRepository:
 
         # Special case: status='picked' → is_picked=1
         if status == "picked":
-            where_clause = "is_picked = 1"
+            where_parts = ["is_picked = 1"]
+            params: list = []
         else:
-            where_clause = "status = ?"
+            where_parts = ["status = ?"]
+            params = [status]
         if journal is not None:
-            where_clause += " AND journal = ?"
+            where_parts.append("journal = ?")
+            params.append(journal)
+        if q:
+            where_parts.append("search_text LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(q.lower()))
+        where_clause = " AND ".join(where_parts)
+        params.extend([limit, offset])
 
         with self._connection() as conn:
             cursor = conn.cursor()
-            if status == "picked":
-                params: tuple = (limit, offset) if journal is None else (journal, limit, offset)
-                cursor.execute(
-                    f"""
-                    SELECT id, source, title, link, doi, published, authors, journal, abstract, status, is_picked, created_at
-                    FROM papers
-                    WHERE {where_clause}
-                    ORDER BY {order_sql}
-                    LIMIT ? OFFSET ?
-                    """,
-                    params,
-                )
-            else:
-                params = (status, limit, offset) if journal is None else (status, journal, limit, offset)
-                cursor.execute(
-                    f"""
-                    SELECT id, source, title, link, doi, published, authors, journal, abstract, status, is_picked, created_at
-                    FROM papers
-                    WHERE {where_clause}
-                    ORDER BY {order_sql}
-                    LIMIT ? OFFSET ?
-                    """,
-                    params,
-                )
+            cursor.execute(
+                f"""
+                SELECT id, source, title, link, doi, published, authors, journal, abstract, status, is_picked, created_at
+                FROM papers
+                WHERE {where_clause}
+                ORDER BY {order_sql}
+                LIMIT ? OFFSET ?
+                """,
+                params,
+            )
             rows = cursor.fetchall()
 
-        papers = []
-        for row in rows:
-            paper = Paper(
-                source=row["source"],
-                title=row["title"],
-                link=row["link"],
-                doi=row["doi"],
-                published=row["published"],
-                authors=row["authors"],
-                journal=row["journal"],
-                abstract=row["abstract"],
-                id=row["id"],
-                status=row["status"],
-                is_picked=row["is_picked"],
-                created_at=row["created_at"],
-            )
-            papers.append(paper)
+        papers = [Paper.from_row(row) for row in rows]
 
         return papers
 
-    def find_picked(self, limit: int = 100, offset: int = 0, order: str = "desc") -> list[Paper]:
+    def find_picked(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = "desc",
+        q: Optional[str] = None,
+    ) -> list[Paper]:
         """Find picked papers for export (is_picked=1).
 
         Args:
             limit: Maximum number of papers to return
             offset: Number of rows to skip (for pagination)
             order: 'asc' or 'desc' for date sort direction
+            q: If set, match this substring in title/journal/authors.
 
         Returns:
             List of Paper objects
         """
         direction = "DESC" if order.lower() == "desc" else "ASC"
+        where_parts = ["is_picked = 1"]
+        params: list = []
+        if q:
+            where_parts.append("search_text LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(q.lower()))
+        params.extend([limit, offset])
         with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 f"""
                 SELECT id, source, title, link, doi, published, authors, journal, abstract, status, is_picked, created_at
                 FROM papers
-                WHERE is_picked = 1
+                WHERE {" AND ".join(where_parts)}
                 ORDER BY COALESCE(published, created_at) {direction}
                 LIMIT ? OFFSET ?
                 """,
-                (limit, offset),
+                params,
             )
             rows = cursor.fetchall()
 
-        papers = []
-        for row in rows:
-            paper = Paper(
-                source=row["source"],
-                title=row["title"],
-                link=row["link"],
-                doi=row["doi"],
-                published=row["published"],
-                authors=row["authors"],
-                journal=row["journal"],
-                abstract=row["abstract"],
-                id=row["id"],
-                status=row["status"],
-                is_picked=row["is_picked"],
-                created_at=row["created_at"],
-            )
-            papers.append(paper)
+        papers = [Paper.from_row(row) for row in rows]
 
         return papers
 
@@ -312,6 +409,9 @@ class PaperRepository:
         Returns:
             Dict with keys 'new', 'archived', 'read', 'picked' and counts.
         """
+        cached = self._cache_get("status_counts")
+        if cached is not None:
+            return cached
         with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -324,12 +424,12 @@ class PaperRepository:
                 "SELECT COUNT(*) AS cnt FROM papers WHERE is_picked = 1"
             )
             picked = cursor.fetchone()["cnt"]
-        return {
+        return self._cache_put("status_counts", {
             "new": by_status.get("new", 0),
             "archived": by_status.get("archived", 0),
             "read": by_status.get("read", 0),
             "picked": picked,
-        }
+        })
 
     def get_distinct_journals(self) -> list[str]:
         """Return distinct non-null journal names from the DB, sorted.
@@ -337,6 +437,9 @@ class PaperRepository:
         Returns:
             Sorted list of journal name strings.
         """
+        cached = self._cache_get("distinct_journals")
+        if cached is not None:
+            return cached
         with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -346,7 +449,8 @@ class PaperRepository:
                 ORDER BY journal ASC
                 """
             )
-            return [row["journal"] for row in cursor.fetchall()]
+            journals = [row["journal"] for row in cursor.fetchall()]
+        return self._cache_put("distinct_journals", journals)
 
     def get_date_range(self, status: Optional[str] = None, date_field: str = "published") -> dict[str, Optional[str]]:
         """Get min and max dates for papers.
@@ -413,22 +517,9 @@ class PaperRepository:
         if row is None:
             return None
 
-        return Paper(
-            source=row["source"],
-            title=row["title"],
-            link=row["link"],
-            doi=row["doi"],
-            published=row["published"],
-            authors=row["authors"],
-            journal=row["journal"],
-            abstract=row["abstract"],
-            id=row["id"],
-            status=row["status"],
-            is_picked=row["is_picked"],
-            created_at=row["created_at"],
-        )
-
-    def find_all(self, limit: int = 500, offset: int = 0, sort_by: str = "id", order: str = "desc", journal: Optional[str] = None) -> list[Paper]:
+        return Paper.from_row(row)
+
+    def find_all(self, limit: int = 500, offset: int = 0, sort_by: str = "id", order: str = "desc", journal: Optional[str] = None, q: Optional[str] = None) -> list[Paper]:
         """Find papers from all statuses (for archive view).
 
         Args:
@@ -437,6 +528,7 @@ class PaperRepository:
             sort_by: 'id', 'date', or 'title'
             order: 'asc' or 'desc' for sort direction
             journal: If set, filter by this journal name only.
+            q: If set, match this substring in title/journal/authors.
 
         Returns:
             List of Paper objects
@@ -450,8 +542,16 @@ class PaperRepository:
             "created_at": f"created_at {direction}",
         }
         order_sql = order_clauses.get(sort_by, f"id {direction}")
-        where_clause = "" if journal is None else "WHERE journal = ?"
-        params: tuple = (limit, offset) if journal is None else (journal, limit, offset)
+        where_parts: list[str] = []
+        params: list = []
+        if journal is not None:
+            where_parts.append("journal = ?")
+            params.append(journal)
+        if q:
+            where_parts.append("search_text LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(q.lower()))
+        where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+        params.extend([limit, offset])
         with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -466,23 +566,7 @@ class PaperRepository:
             )
             rows = cursor.fetchall()
 
-        papers = []
-        for row in rows:
-            paper = Paper(
-                source=row["source"],
-                title=row["title"],
-                link=row["link"],
-                doi=row["doi"],
-                published=row["published"],
-                authors=row["authors"],
-                journal=row["journal"],
-                abstract=row["abstract"],
-                id=row["id"],
-                status=row["status"],
-                is_picked=row["is_picked"],
-                created_at=row["created_at"],
-            )
-            papers.append(paper)
+        papers = [Paper.from_row(row) for row in rows]
         return papers
 
     def pick(self, ids: list[int]) -> int:
@@ -505,6 +589,7 @@ class PaperRepository:
                 ids,
             )
             conn.commit()
+            self._invalidate_stats_cache()
             return cursor.rowcount
 
     def unpick(self, ids: list[int]) -> list[int]:
@@ -537,6 +622,7 @@ class PaperRepository:
                 picked_ids,
             )
             conn.commit()
+            self._invalidate_stats_cache()
             return picked_ids
 
     def mark_exported(self, paper_ids: list[int]) -> None:
@@ -556,6 +642,7 @@ class PaperRepository:
                 paper_ids,
             )
             conn.commit()
+        self._invalidate_stats_cache()
 
     def undo_read(self, paper_id: int) -> bool:
         """Undo a read: move paper to 'archived' and set is_picked=1.
@@ -573,6 +660,7 @@ class PaperRepository:
                 (paper_id,),
             )
             conn.commit()
+            self._invalidate_stats_cache()
             return cursor.rowcount > 0
 
     def revert_undo_read(self, paper_id: int) -> bool:
@@ -591,6 +679,7 @@ class PaperRepository:
                 (paper_id,),
             )
             conn.commit()
+            self._invalidate_stats_cache()
             return cursor.rowcount > 0
 
     def reset_all_picked(self) -> int:
@@ -606,6 +695,7 @@ class PaperRepository:
             cursor = conn.cursor()
             cursor.execute("UPDATE papers SET is_picked = 0 WHERE is_picked = 1")
             conn.commit()
+            self._invalidate_stats_cache()
             return cursor.rowcount
 
     # ------------------------------------------------------------------
@@ -4,6 +4,7 @@ import os
 from typing import Literal
 
 from fastapi import APIRouter, BackgroundTasks, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, Response
 
 from paperbot.gui.helpers import filter_by_date, filter_by_keywords
@@ -43,11 +44,8 @@ def _do_fetch():
         # Step 2: Snapshot current 'new' paper IDs before upserting
         old_new_ids = state.repo.get_new_paper_ids()
 
-        # Step 3: Upsert fetched papers — count genuinely new ones
-        total_new = 0
-        for paper in fetched_papers:
-            if state.repo.upsert(paper):
-                total_new += 1
+        # Step 3: Upsert fetched papers in one transaction — count genuinely new ones
+        total_new = state.repo.upsert_many(fetched_papers)
 
         # Step 4: If no new papers, do nothing — keep existing New tab as-is
         if total_new == 0:
@@ -149,7 +147,7 @@ def _toast_error(message: str) -> str:
 
 
 @router.post("/actions/export", response_class=HTMLResponse)
-async def export_picked(
+def export_picked(
     request: Request,
     format: str = Form("md"),
 ):
@@ -176,7 +174,7 @@ async def export_picked(
 
 
 @router.post("/actions/export-read", response_class=HTMLResponse)
-async def export_read(
+def export_read(
     request: Request,
     scope: str = Form(...),  # "all" | "filtered"
     format: str = Form("md"),
@@ -191,15 +189,10 @@ async def export_read(
     if scope == "all":
         papers = state.repo.find_by_status("read", limit=5000, sort_by="created_at", order="desc", journal=None)
     else:
-        papers = state.repo.find_by_status("read", limit=5000, sort_by="created_at", order="desc", journal=journal or None)
-        if q:
-            q_lower = q.lower()
-            papers = [
-                p for p in papers
-                if q_lower in (p.title or "").lower()
-                or q_lower in (p.journal or "").lower()
-                or q_lower in (p.authors or "").lower()
-            ]
+        papers = state.repo.find_by_status(
+            "read", limit=5000, sort_by="created_at", order="desc",
+            journal=journal or None, q=q or None,
+        )
         if keywords:
             kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
             papers = filter_by_keywords(papers, kw_list, keyword_mode)
@@ -226,7 +219,7 @@ async def export_read(
 
 
 @router.post("/actions/promote-to-read", response_class=HTMLResponse)
-async def promote_to_read(request: Request):
+def promote_to_read(request: Request):
     """Mark all picked papers as read without exporting to file."""
     picked_papers = state.repo.find_picked()
     if not picked_papers:
@@ -254,14 +247,14 @@ async def promote_to_read(request: Request):
 @router.post("/actions/pick/{paper_id}", response_class=HTMLResponse)
 async def pick_paper(request: Request, paper_id: int):
     """Toggle pick status for a paper."""
-    # Check current status
-    paper = state.repo.find_by_id(paper_id)
+    # Check current status (SQLite is blocking; keep it off the event loop)
+    paper = await run_in_threadpool(state.repo.find_by_id, paper_id)
 
     if paper:
         if paper.is_picked:
-            state.repo.unpick([paper_id])
+            await run_in_threadpool(state.repo.unpick, [paper_id])
         else:
-            state.repo.pick([paper_id])
+            await run_in_threadpool(state.repo.pick, [paper_id])
 
     new_picked = not paper.is_picked if paper else False
 
@@ -320,7 +313,7 @@ async def pick_paper(request: Request, paper_id: int):
 
 
 @router.post("/actions/undo-read/{paper_id}", response_class=HTMLResponse)
-async def undo_read(request: Request, paper_id: int):
+def undo_read(request: Request, paper_id: int):
     """Undo read: move paper to archived + picked, show toast with revert."""
     paper = state.repo.find_by_id(paper_id)
     if not paper:
@@ -348,7 +341,7 @@ async def undo_read(request: Request, paper_id: int):
 
 
 @router.post("/actions/revert-undo-read/{paper_id}", response_class=HTMLResponse)
-async def revert_undo_read(request: Request, paper_id: int):
+def revert_undo_read(request: Request, paper_id: int):
     """Revert undo-read: move paper back to read, is_picked=0."""
     state.repo.revert_undo_read(paper_id)
 
@@ -370,7 +363,7 @@ async def pick_all(request: Request, ids: str = Form(...)):
     try:
         paper_ids = [int(x) for x in ids.split(",") if x.strip()]
         if paper_ids:
-            state.repo.pick(paper_ids)
+            await run_in_threadpool(state.repo.pick, paper_ids)
         return HTMLResponse('<span class="text-green-600 text-sm">선택됨!</span>')
     except Exception as e:
         return HTMLResponse(f'<span class="text-red-600 text-sm">오류: {str(e)}</span>')
@@ -382,7 +375,7 @@ async def unpick_all(request: Request, ids: str = Form(...)):
     try:
         paper_ids = [int(x) for x in ids.split(",") if x.strip()]
         if paper_ids:
-            state.repo.unpick(paper_ids)
+            await run_in_threadpool(state.repo.unpick, paper_ids)
         return HTMLResponse('<span class="text-green-600 text-sm">선택 해제됨!</span>')
     except Exception as e:
         return HTMLResponse(f'<span class="text-red-600 text-sm">오류: {str(e)}</span>')
@@ -1,9 +1,11 @@
 """Common routes: index page, stats, badges, date-range, journals, LLM models/profiles."""
 
+import hashlib
 from dataclasses import asdict
 
+import orjson
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 
 from paperbot import __version__
@@ -13,13 +15,28 @@ from paperbot.gui.state import state, templates
 router = APIRouter()
 
 
+def _conditional_json(request: Request, payload: dict) -> Response:
+    """Serve *payload* as JSON with an ETag; answer 304 when unchanged.
+
+    The polled endpoints return the same payload for long stretches, so
+    tagging the body lets the browser revalidate against its cache and
+    skip re-downloading (and re-parsing) identical responses.
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # ============================================================================
 # Main Page
 # ============================================================================
 
 
 @router.get("/", response_class=HTMLResponse)
-async def index(request: Request):
+def index(request: Request):
     """Main dashboard page."""
     stats = state.repo.get_status_counts()
     journals = state.repo.get_distinct_journals()
@@ -50,7 +67,7 @@ async def preferences(request: Request):
 
 
 @router.get("/stats", response_class=HTMLResponse)
-async def get_stats(request: Request):
+def get_stats(request: Request):
     """Get stats partial for sidebar."""
     stats = state.repo.get_status_counts()
     return templates.TemplateResponse(
@@ -60,10 +77,10 @@ async def get_stats(request: Request):
 
 
 @router.get("/stats/badges", response_class=HTMLResponse)
-async def get_badges(request: Request):
+def get_badges(request: Request):
     """Get badge counts as JSON for tab updates and export dropdown."""
     stats = state.repo.get_status_counts()
-    return JSONResponse({
+    return _conditional_json(request, {
         "new": stats.get("new", 0),
         "picked": stats.get("picked", 0),
         "read": stats.get("read", 0),
@@ -72,7 +89,7 @@ async def get_badges(request: Request):
 
 
 @router.get("/date-range")
-async def get_date_range(
+def get_date_range(
     tab: str = Query("new", description="Tab name: new, picked, archive, read, all"),
 ):
     """Get min/max date range for papers in the given tab."""
@@ -95,7 +112,7 @@ async def get_date_range(
         status = None
 
     date_range = state.repo.get_date_range(status=status, date_field=date_field)
-    return JSONResponse({
+    return ORJSONResponse({
         "min_date": date_range["min_date"],
         "max_date": date_range["max_date"],
         "date_field": "collected" if tab == "read" else "published",
@@ -108,9 +125,9 @@ async def get_date_range(
 
 
 @router.get("/actions/ranking-status")
-async def ranking_status():
+async def ranking_status(request: Request):
     """Return current ranking progress as JSON for frontend polling."""
-    return JSONResponse(state.ranking_status)
+    return _conditional_json(request, state.ranking_status)
 
 
 # ============================================================================
@@ -119,7 +136,7 @@ async def ranking_status():
 
 
 @router.get("/journals", response_class=HTMLResponse)
-async def get_journals(request: Request):
+def get_journals(request: Request):
     """Get journal options for filter dropdown."""
     journals = state.repo.get_distinct_journals()
     options = ['<option value="">전체 저널</option>']
@@ -141,7 +158,7 @@ class EmailPayload(BaseModel):
 @router.get("/api/email")
 async def get_email():
     """Return the current contact email."""
-    return JSONResponse({"email": state.settings.contact_email or ""})
+    return ORJSONResponse({"email": state.settings.contact_email or ""})
 
 
 @router.put("/api/email")
@@ -153,7 +170,7 @@ async def update_email(body: EmailPayload):
     if hasattr(state, "crossref") and state.crossref is not None:
         state.crossref.contact_email = email
     save_email(state.settings.metadata_dir / "email.yaml", email)
-    return JSONResponse({"email": email or ""})
+    return ORJSONResponse({"email": email or ""})
 
 
 # ============================================================================
@@ -169,7 +186,7 @@ async def get_llm_models():
     ``<select>`` dropdown.
     """
     models = load_llm_models()
-    return JSONResponse([asdict(m) for m in models])
+    return ORJSONResponse([asdict(m) for m in models])
 
 
 # ============================================================================
@@ -206,7 +223,7 @@ def _sync_to_disk() -> None:
 async def list_profiles():
     """Return all LLM profiles and the active profile id."""
     s = state.settings
-    return JSONResponse({
+    return ORJSONResponse({
         "active": s.active_llm_id,
         "profiles": [
             {"id": p.id, "name": p.name, "model": p.model, "api_key": p.api_key}
@@ -227,7 +244,7 @@ async def create_profile(body: ProfilePayload):
     if s.active_llm_id is None:
         s.active_llm_id = pid
     _sync_to_disk()
-    return JSONResponse(
+    return ORJSONResponse(
         {"id": profile.id, "name": profile.name, "model": profile.model, "api_key": profile.api_key},
         status_code=201,
     )
@@ -241,10 +258,10 @@ async def set_active_profile(body: SetActivePayload):
     if body.id is not None:
         exists = any(p.id == body.id for p in s.llm_profiles)
         if not exists:
-            return JSONResponse({"error": "Profile not found"}, status_code=404)
+            return ORJSONResponse({"error": "Profile not found"}, status_code=404)
     s.active_llm_id = body.id
     _sync_to_disk()
-    return JSONResponse({"active": s.active_llm_id})
+    return ORJSONResponse({"active": s.active_llm_id})
 
 
 @router.put("/api/llm-profiles/{profile_id}")
@@ -253,12 +270,12 @@ async def update_profile(profile_id: str, body: ProfilePayload):
     s = state.settings
     target = next((p for p in s.llm_profiles if p.id == profile_id), None)
     if target is None:
-        return JSONResponse({"error": "Profile not found"}, status_code=404)
+        return ORJSONResponse({"error": "Profile not found"}, status_code=404)
     target.name = body.name
     target.model = body.model
     target.api_key = body.api_key
     _sync_to_disk()
-    return JSONResponse({"id": target.id, "name": target.name, "model": target.model, "api_key": target.api_key})
+    return ORJSONResponse({"id": target.id, "name": target.name, "model": target.model, "api_key": target.api_key})
 
 
 @router.delete("/api/llm-profiles/{profile_id}")
@@ -268,11 +285,11 @@ async def delete_profile(profile_id: str):
     before = len(s.llm_profiles)
     s.llm_profiles = [p for p in s.llm_profiles if p.id != profile_id]
     if len(s.llm_profiles) == before:
-        return JSONResponse({"error": "Profile not found"}, status_code=404)
+        return ORJSONResponse({"error": "Profile not found"}, status_code=404)
     if s.active_llm_id == profile_id:
         s.active_llm_id = s.llm_profiles[0].id if s.llm_profiles else None
     _sync_to_disk()
-    return JSONResponse({"ok": True})
+    return ORJSONResponse({"ok": True})
 
 
 # ============================================================================
@@ -300,7 +317,7 @@ def _sync_feeds_to_disk() -> None:
 async def list_feeds():
     """Return all journal feeds."""
     s = state.settings
-    return JSONResponse([
+    return ORJSONResponse([
         {"id": f.id, "name": f.name, "url": f.url, "issn": f.issn}
         for f in s.feeds
     ])
@@ -314,7 +331,7 @@ async def create_feed(body: FeedPayload):
     feed = Feed(id=fid, name=body.name, url=body.url, issn=body.issn)
     state.settings.feeds.append(feed)
     _sync_feeds_to_disk()
-    return JSONResponse(
+    return ORJSONResponse(
         {"id": feed.id, "name": feed.name, "url": feed.url, "issn": feed.issn},
         status_code=201,
     )
@@ -326,12 +343,12 @@ async def update_feed(feed_id: str, body: FeedPayload):
     s = state.settings
     target = next((f for f in s.feeds if f.id == feed_id), None)
     if target is None:
-        return JSONResponse({"error": "Feed not found"}, status_code=404)
+        return ORJSONResponse({"error": "Feed not found"}, status_code=404)
     target.name = body.name
     target.url = body.url
     target.issn = body.issn
     _sync_feeds_to_disk()
-    return JSONResponse({"id": target.id, "name": target.name, "url": target.url, "issn": target.issn})
+    return ORJSONResponse({"id": target.id, "name": target.name, "url": target.url, "issn": target.issn})
 
 
 @router.delete("/api/feeds/{feed_id}")
@@ -341,9 +358,9 @@ async def delete_feed(feed_id: str):
     before = len(s.feeds)
     s.feeds = [f for f in s.feeds if f.id != feed_id]
     if len(s.feeds) == before:
-        return JSONResponse({"error": "Feed not found"}, status_code=404)
+        return ORJSONResponse({"error": "Feed not found"}, status_code=404)
     _sync_feeds_to_disk()
-    return JSONResponse({"ok": True})
+    return ORJSONResponse({"ok": True})
 
 
 # ============================================================================
@@ -355,7 +372,7 @@ async def delete_feed(feed_id: str):
 async def get_paths():
     """Return current storage paths (read-only)."""
     s = state.settings
-    return JSONResponse({
+    return ORJSONResponse({
         "db_path": str(s.db_path),
         "metadata_dir": str(s.metadata_dir),
         "feeds_path": str(s.feeds_path),
@@ -1,6 +1,7 @@
 """Paper list endpoints (HTMX partials) and paper detail views."""
 
 from fastapi import APIRouter, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 
 from paperbot.gui.helpers import (
@@ -57,7 +58,7 @@ def _paper_list_response(
 
 
 @router.get("/papers/new", response_class=HTMLResponse)
-async def papers_new(
+def papers_new(
     request: Request,
     q: str = Query("", description="Search query"),
     journal: str = Query("", description="Journal filter"),
@@ -72,20 +73,11 @@ async def papers_new(
     """Get new papers list (partial for HTMX)."""
     journal_filter = journal if journal else None
     papers = state.repo.find_by_status(
-        "new", limit=PAGE_SIZE, offset=offset, sort_by="published", order="desc", journal=journal_filter
+        "new", limit=PAGE_SIZE, offset=offset, sort_by="published", order="desc",
+        journal=journal_filter, q=q or None,
     )
     raw_len = len(papers)
 
-    # Filter by search query if provided
-    if q:
-        q_lower = q.lower()
-        papers = [
-            p for p in papers
-            if q_lower in (p.title or "").lower()
-            or q_lower in (p.journal or "").lower()
-            or q_lower in (p.authors or "").lower()
-        ]
-
     # Filter by keywords
     if keywords:
         kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
@@ -127,7 +119,7 @@ async def papers_new(
 
 
 @router.get("/papers/picked", response_class=HTMLResponse)
-async def papers_picked(
+def papers_picked(
     request: Request,
     q: str = Query(""),
     sort_by: str = Query("published", description="Sort criteria"),
@@ -139,17 +131,9 @@ async def papers_picked(
     offset: int = Query(0, description="Pagination offset for lazy load"),
 ):
     """Get picked papers list (partial for HTMX)."""
-    papers = state.repo.find_picked(limit=PAGE_SIZE, offset=offset, order="desc")
+    papers = state.repo.find_picked(limit=PAGE_SIZE, offset=offset, order="desc", q=q or None)
     raw_len = len(papers)
 
-    if q:
-        q_lower = q.lower()
-        papers = [
-            p for p in papers
-            if q_lower in (p.title or "").lower()
-            or q_lower in (p.journal or "").lower()
-        ]
-
     if keywords:
         kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
         papers = filter_by_keywords(papers, kw_list, keyword_mode)
@@ -171,7 +155,7 @@ async def papers_picked(
 
 
 @router.get("/papers/archive", response_class=HTMLResponse)
-async def papers_archive(
+def papers_archive(
     request: Request,
     q: str = Query(""),
     journal: str = Query(""),
@@ -186,18 +170,11 @@ async def papers_archive(
     """Get archived papers list (partial for HTMX)."""
     journal_filter = journal if journal else None
     papers = state.repo.find_by_status(
-        "archived", limit=PAGE_SIZE, offset=offset, sort_by="date", order="desc", journal=journal_filter
+        "archived", limit=PAGE_SIZE, offset=offset, sort_by="date", order="desc",
+        journal=journal_filter, q=q or None,
     )
     raw_len = len(papers)
 
-    if q:
-        q_lower = q.lower()
-        papers = [
-            p for p in papers
-            if q_lower in (p.title or "").lower()
-            or q_lower in (p.journal or "").lower()
-        ]
-
     if keywords:
         kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
         papers = filter_by_keywords(papers, kw_list, keyword_mode)
@@ -219,7 +196,7 @@ async def papers_archive(
 
 
 @router.get("/papers/read", response_class=HTMLResponse)
-async def papers_read(
+def papers_read(
     request: Request,
     q: str = Query(""),
     journal: str = Query(""),
@@ -234,19 +211,11 @@ async def papers_read(
     """Get read papers list (partial for HTMX). Sorted by created_at (read date)."""
     journal_filter = journal if journal else None
     papers = state.repo.find_by_status(
-        "read", limit=PAGE_SIZE, offset=offset, sort_by="created_at", order="desc", journal=journal_filter
+        "read", limit=PAGE_SIZE, offset=offset, sort_by="created_at", order="desc",
+        journal=journal_filter, q=q or None,
     )
     raw_len = len(papers)
 
-    if q:
-        q_lower = q.lower()
-        papers = [
-            p for p in papers
-            if q_lower in (p.title or "").lower()
-            or q_lower in (p.journal or "").lower()
-            or q_lower in (p.authors or "").lower()
-        ]
-
     if keywords:
         kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
         papers = filter_by_keywords(papers, kw_list, keyword_mode)
@@ -268,7 +237,7 @@ async def papers_read(
 
 
 @router.get("/papers/all", response_class=HTMLResponse)
-async def papers_all(
+def papers_all(
     request: Request,
     q: str = Query(""),
     journal: str = Query(""),
@@ -283,19 +252,11 @@ async def papers_all(
     """Get all papers in DB (partial for HTMX)."""
     journal_filter = journal if journal else None
     papers = state.repo.find_all(
-        limit=PAGE_SIZE, offset=offset, sort_by="date", order="desc", journal=journal_filter
+        limit=PAGE_SIZE, offset=offset, sort_by="date", order="desc",
+        journal=journal_filter, q=q or None,
     )
     raw_len = len(papers)
 
-    if q:
-        q_lower = q.lower()
-        papers = [
-            p for p in papers
-            if q_lower in (p.title or "").lower()
-            or q_lower in (p.journal or "").lower()
-            or q_lower in (p.authors or "").lower()
-        ]
-
     if keywords:
         kw_list = [k.strip() for k in keywords.split(",") if k.strip()]
         papers = filter_by_keywords(papers, kw_list, keyword_mode)
@@ -324,7 +285,8 @@ async def papers_all(
 @router.get("/papers/{paper_id}", response_class=HTMLResponse)
 async def paper_detail(request: Request, paper_id: int):
     """Get paper detail view (partial for HTMX)."""
-    paper = state.repo.find_by_id(paper_id)
+    # SQLite access is blocking; keep it off the event loop
+    paper = await run_in_threadpool(state.repo.find_by_id, paper_id)
 
     if not paper:
         return HTMLResponse("<div class='p-8 text-center text-content-muted'>논문을 찾을 수 없습니다.</div>")
@@ -354,7 +316,7 @@ async def paper_detail(request: Request, paper_id: int):
 @router.get("/papers/{paper_id}/enrich", response_class=HTMLResponse)
 async def paper_detail_enrich(request: Request, paper_id: int):
     """Fetch OpenAlex metadata by DOI and return HTML fragment."""
-    paper = state.repo.find_by_id(paper_id)
+    paper = await run_in_threadpool(state.repo.find_by_id, paper_id)
     if not paper or not paper.doi:
         return HTMLResponse(
             "<div class='mb-6 text-sm text-content-muted'>DOI가 없어 OpenAlex 정보를 불러올 수 없습니다.</div>"
@@ -391,7 +353,7 @@ async def paper_detail_enrich(request: Request, paper_id: int):
 
 
 @router.get("/papers/{paper_id}/ai-insight", response_class=HTMLResponse)
-async def paper_ai_insight(request: Request, paper_id: int):
+def paper_ai_insight(request: Request, paper_id: int):
     """Return AI Semantic Insight HTML fragment for a single paper.
 
     Uses Bi-Encoder cosine similarity to find the most relevant READ
@@ -5,7 +5,7 @@ from __future__ import annotations
 import threading
 
 from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from paperbot.gui.state import state
 
@@ -28,7 +28,7 @@ async def semantic_map(
     """
     smap = state.semantic_map_service
     if smap is None:
-        return JSONResponse(
+        return ORJSONResponse(
             {"status": "error", "message": "Semantic map service not initialised"},
             status_code=503,
         )
@@ -40,7 +40,7 @@ async def semantic_map(
     if computing:
         # If computing for a different status, wait for it to finish
         # then the client will re-trigger
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "computing",
             "message": state.smap_status.get("message", "계산 중…"),
         })
@@ -50,11 +50,11 @@ async def semantic_map(
     if cached is not None:
         cached_status = getattr(state, "_smap_cache_status", None)
         if cached_status == status:
-            return JSONResponse({"status": "ready", "data": cached})
+            return ORJSONResponse({"status": "ready", "data": cached})
 
     # Start background computation
     _start_smap_bg(status)
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "computing",
         "message": "Semantic map 계산을 시작합니다…",
     })
@@ -64,16 +64,16 @@ async def semantic_map(
 async def semantic_map_status():
     """Poll computation progress."""
     if getattr(state, "_smap_computing", False):
-        return JSONResponse({
+        return ORJSONResponse({
             "status": "computing",
             "message": state.smap_status.get("message", "계산 중…"),
         })
 
     cached = getattr(state, "_smap_cache", None)
     if cached is not None:
-        return JSONResponse({"status": "ready", "data": cached})
+        return ORJSONResponse({"status": "ready", "data": cached})
 
-    return JSONResponse({"status": "idle"})
+    return ORJSONResponse({"status": "idle"})
 
 
 # ============================================================================
@@ -60,6 +60,11 @@ state = AppState()
 base_dir = os.path.dirname(__file__)
 templates = Jinja2Templates(directory=os.path.join(base_dir, "templates"))
 
+# Templates don't change at runtime: keep compiled templates cached
+# instead of stat-ing the source file on every render (Jinja's
+# auto_reload defaults to True).
+templates.env.auto_reload = False
+
 # Unescape HTML entities in abstracts
 templates.env.filters["unescape_html"] = lambda s: html.unescape(s) if s else ""
 
@@ -1,5 +1,6 @@
 """Paper data model."""
 
+import sqlite3
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional
 
@@ -23,3 +24,21 @@ class Paper:
     status: Literal["new", "archived", "read"] = "new"
     is_picked: int = 0
     created_at: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Paper":
+        """Build a Paper from a database row (named-column access)."""
+        return cls(
+            source=row["source"],
+            title=row["title"],
+            link=row["link"],
+            doi=row["doi"],
+            published=row["published"],
+            authors=row["authors"],
+            journal=row["journal"],
+            abstract=row["abstract"],
+            id=row["id"],
+            status=row["status"],
+            is_picked=row["is_picked"],
+            created_at=row["created_at"],
+        )
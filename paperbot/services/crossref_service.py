@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from paperbot.utils.text import normalize_doi
 
@@ -20,14 +22,43 @@ class CrossrefService:
         Args:
             contact_email: Email for polite pool access (recommended by Crossref)
         """
+        # One pooled session shared by all fetch workers: keep-alive
+        # connections are reused instead of paying a TCP+TLS handshake
+        # per lookup, and transient 429/5xx responses are retried with
+        # backoff.  pool_maxsize stays above FeedService's max_workers.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self._session.mount("https://", adapter)
         self.contact_email = contact_email
+
+    @property
+    def contact_email(self) -> Optional[str]:
+        """Email used for Crossref polite-pool access."""
+        return self._contact_email
+
+    @contact_email.setter
+    def contact_email(self, value: Optional[str]) -> None:
+        """Set the contact email and refresh the session headers."""
+        self._contact_email = value
         self._headers = self._build_headers()
+        self._session.headers.pop("User-Agent", None)
+        self._session.headers.update(self._headers)
 
     def _build_headers(self) -> dict[str, str]:
         """Build HTTP headers with user agent."""
         if self.contact_email:
             return {"User-Agent": f"paperbot/1.0 (mailto:{self.contact_email})"}
-        return {}
+        # Crossref asks for an identifying User-Agent even outside the
+        # polite pool; don't fall back to python-requests' default.
+        return {"User-Agent": "paperbot/1.0"}
 
     def lookup(self, doi: str, timeout: int = 20) -> dict[str, Any]:
         """Look up paper metadata by DOI.
@@ -43,7 +74,7 @@ class CrossrefService:
             requests.RequestException: On API errors
         """
         url = f"{CROSSREF_API_BASE}/{requests.utils.quote(doi)}"
-        response = requests.get(url, headers=self._headers, timeout=timeout)
+        response = self._session.get(url, timeout=timeout)
         response.raise_for_status()
         return response.json().get("message", {})
 
@@ -99,10 +130,9 @@ class CrossrefService:
         if self.contact_email:
             params["mailto"] = self.contact_email
 
-        response = requests.get(
+        response = self._session.get(
             CROSSREF_API_BASE,
             params=params,
-            headers=self._headers,
             timeout=timeout,
         )
         response.raise_for_status()
@@ -4,19 +4,23 @@ import csv
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Literal, TextIO
 
 from paperbot.models.paper import Paper
 
 Format = Literal["tex", "md", "csv"]
 EXT: dict[str, str] = {"tex": ".bib", "md": ".md", "csv": ".csv"}
 
+# Compiled once at import; these run per paper during an export
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_AUTHOR_SPLIT_RE = re.compile(r"[;,]")
+
 
 def _bib_slug(title: str, paper_id: int) -> str:
     """Generate short slug from title for BibTeX citation key."""
     if not title:
         return f"paper_{paper_id}"
-    words = re.sub(r"[^\w\s]", "", title).split()[:3]
+    words = _NON_WORD_RE.sub("", title).split()[:3]
     slug = "_".join(w.lower() for w in words if w)[:40]
     return slug or f"paper_{paper_id}"
 
@@ -26,7 +30,7 @@ def _bib_author(authors: str | None) -> str:
     if not authors or not authors.strip():
         return "Unknown"
     # Semicolon or comma -> " and "
-    parts = re.split(r"[;,]", authors)
+    parts = _AUTHOR_SPLIT_RE.split(authors)
     parts = [p.strip() for p in parts if p.strip()]
     if not parts:
         return "Unknown"
@@ -35,10 +39,9 @@ def _bib_author(authors: str | None) -> str:
     return " and ".join(parts)
 
 
-def _content_tex(papers: list[Paper]) -> str:
-    """Generate BibTeX content."""
-    lines = []
-    for p in papers:
+def _write_tex(f: TextIO, papers: list[Paper]) -> None:
+    """Write BibTeX content to *f*, one entry at a time."""
+    for i, p in enumerate(papers):
         year = (p.published or "")[:4] or "0000"
         month = (p.published or "-")[5:7] if len(p.published or "") >= 7 else "01"
         day = (p.published or "-")[8:10] if len(p.published or "") >= 10 else "01"
@@ -59,22 +62,23 @@ def _content_tex(papers: list[Paper]) -> str:
         if doi:
             block += f"\n  url     = {{https://doi.org/{doi}}}"
         block += "\n}\n"
-        lines.append(block)
-    return "\n".join(lines)
+        if i:
+            f.write("\n")
+        f.write(block)
 
 
-def _content_md(papers: list[Paper], export_date: str) -> str:
-    """Generate Markdown content (PaperBot Export List style)."""
-    lines = [f"# PaperBot Export List ({export_date})\n"]
+def _write_md(f: TextIO, papers: list[Paper], export_date: str) -> None:
+    """Write Markdown content (PaperBot Export List style) to *f*."""
+    f.write(f"# PaperBot Export List ({export_date})\n")
     for p in papers:
         title = p.title or "(No title)"
-        lines.append(f"## {title}\n")
+        lines = [f"## {title}\n"]
         if p.journal:
             lines.append(f"- **Journal**: {p.journal}")
         authors = (p.authors or "").strip()
         if authors:
             # Show first few authors, then et al.
-            parts = [x.strip() for x in re.split(r"[;,]", authors) if x.strip()]
+            parts = [x.strip() for x in _AUTHOR_SPLIT_RE.split(authors) if x.strip()]
             if len(parts) > 3:
                 authors_display = ", ".join(parts[:3]) + ", et al."
             else:
@@ -87,15 +91,12 @@ def _content_md(papers: list[Paper], export_date: str) -> str:
         elif p.link:
             lines.append(f"- **Link**: {p.link}")
         lines.append("")
-    return "\n".join(lines)
+        f.write("\n" + "\n".join(lines))
 
 
-def _content_csv(papers: list[Paper]) -> str:
-    """Generate CSV content."""
-    import io
-
-    out = io.StringIO()
-    w = csv.writer(out)
+def _write_csv(f: TextIO, papers: list[Paper]) -> None:
+    """Write CSV content to *f*, one row at a time."""
+    w = csv.writer(f)
     w.writerow(["Title", "Journal", "Authors", "Date_Published", "DOI", "Added_Date"])
     for p in papers:
         authors = (p.authors or "").replace(",", "; ").strip()
@@ -113,7 +114,6 @@ def _content_csv(papers: list[Paper]) -> str:
                 added,
             ]
         )
-    return out.getvalue()
 
 
 class MarkdownExporter:
@@ -151,14 +151,16 @@ class MarkdownExporter:
         target_dir.mkdir(parents=True, exist_ok=True)
         filepath = target_dir / f"{stamp}{ext}"
 
+        # Stream each paper straight to disk instead of building the
+        # whole document in memory first
         if format == "tex":
-            content = _content_tex(papers)
+            with open(filepath, "w", encoding="utf-8") as f:
+                _write_tex(f, papers)
         elif format == "csv":
-            content = _content_csv(papers)
+            with open(filepath, "w", encoding="utf-8", newline="") as f:
+                _write_csv(f, papers)
         else:
-            content = _content_md(papers, now.strftime("%Y-%m-%d"))
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+            with open(filepath, "w", encoding="utf-8") as f:
+                _write_md(f, papers, now.strftime("%Y-%m-%d"))
 
         return filepath
@@ -1,23 +1,29 @@
-import uvicorn
 import threading
+import time
 import webbrowser
 
+import uvicorn
+
 from paperbot.gui.app import app
 
-def _open_app_window(url: str) -> None:
-    """Open the app window."""
+
+def _open_when_ready(server: uvicorn.Server, url: str) -> None:
+    """Open the browser once the server is actually accepting connections."""
+    while not server.started:
+        if server.should_exit:
+            return
+        time.sleep(0.05)
     webbrowser.open(url)
-    
+
+
 def run_ui() -> None:
     """Main entry point for UI."""
     host, port = "127.0.0.1", 8001
     url = f"http://{host}:{port}"
 
-    threading.Timer(0.8, lambda: _open_app_window(url)).start()
-    uvicorn.run(
-        app,
-        host=host,
-        port=port,
-        reload=False,
-        access_log=False
-    )
\ No newline at end of file
+    config = uvicorn.Config(app, host=host, port=port, access_log=False)
+    server = uvicorn.Server(config)
+    threading.Thread(
+        target=_open_when_ready, args=(server, url), daemon=True,
+    ).start()
+    server.run()